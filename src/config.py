@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-import json
+
+from src.utils.json_io import read_json, write_json
 
 
 @dataclass
@@ -77,8 +78,7 @@ class PipelineConfig:
     @classmethod
     def from_json(cls, config_path: str) -> "PipelineConfig":
         """Load configuration from JSON file."""
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(config_path)
 
         # Parse chapters
         chapters = []
@@ -109,5 +109,4 @@ class PipelineConfig:
             "chapters": [c.__dict__ for c in self.chapters],
         }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(data, output_path)
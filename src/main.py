@@ -4,6 +4,7 @@ Main entry point for the PDF RAG Parser.
 
 import logging
 import argparse
+import os
 from pathlib import Path
 
 from src.config import PipelineConfig
@@ -41,7 +42,7 @@ def main():
 
     # Validate input file
     input_path = Path(args.input)
-    if not input_path.exists():
+    if not os.access(input_path, os.F_OK):
         logger.error(f"Input file not found: {args.input}")
         return 1
 
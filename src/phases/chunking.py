@@ -417,9 +417,10 @@ class ChunkingPhase:
             metadata: Chunking metadata
             output_path: Path to save the report
         """
-        import json
         from pathlib import Path
 
+        from src.utils.json_io import write_json
+
         report = {
             "total_chunks": metadata.total_chunks,
             "total_characters": metadata.total_characters,
@@ -431,8 +432,7 @@ class ChunkingPhase:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(report, str(output_file))
 
         logger.info(f"Chunking report saved to: {output_path}")
 
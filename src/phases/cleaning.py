@@ -10,6 +10,10 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Approximate page dimensions (standard letter size, in points)
+PAGE_HEIGHT = 792
+PAGE_WIDTH = 612
+
 
 @dataclass
 class CleaningMetadata:
@@ -43,6 +47,13 @@ class TextCleaner:
         self.crop_left_percent = self.config.get("crop_left_percent", 0.0)
         self.crop_right_percent = self.config.get("crop_right_percent", 0.0)
 
+        # Crop boundaries are fixed per cleaner, so compute them once here
+        # rather than for every block
+        self.top_boundary = PAGE_HEIGHT * (self.crop_top_percent / 100)
+        self.bottom_boundary = PAGE_HEIGHT * (1 - self.crop_bottom_percent / 100)
+        self.left_boundary = PAGE_WIDTH * (self.crop_left_percent / 100)
+        self.right_boundary = PAGE_WIDTH * (1 - self.crop_right_percent / 100)
+
         # Compile regex patterns for efficiency
         self.compiled_patterns = []
         for pattern in self.exclude_patterns:
@@ -139,23 +150,13 @@ class TextCleaner:
 
     def _is_in_cropped_area(self, block: Any) -> bool:
         """Check if block is in a cropped area based on position."""
-        # Get page dimensions (approximate)
-        page_height = 792  # Standard letter height in points
-        page_width = 612  # Standard letter width in points
-
-        # Calculate crop boundaries
-        top_boundary = page_height * (self.crop_top_percent / 100)
-        bottom_boundary = page_height * (1 - self.crop_bottom_percent / 100)
-        left_boundary = page_width * (self.crop_left_percent / 100)
-        right_boundary = page_width * (1 - self.crop_right_percent / 100)
-
         # Check if block is outside boundaries
-        if block.y0 < top_boundary or block.y1 > bottom_boundary:
-            return True
-        if block.x0 < left_boundary or block.x1 > right_boundary:
-            return True
-
-        return False
+        return (
+            block.y0 < self.top_boundary
+            or block.y1 > self.bottom_boundary
+            or block.x0 < self.left_boundary
+            or block.x1 > self.right_boundary
+        )
 
     def _clean_content(self, content: str) -> str:
         """Clean individual text content."""
@@ -4,30 +4,33 @@ Extracts text and metadata from PDF documents using configurable libraries.
 """
 
 import logging
+import os
+import sys
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, asdict
+from importlib.util import find_spec
 from pathlib import Path
-import json
 
-try:
-    import fitz  # pymupdf
+from src.utils.json_io import write_json
 
-    HAS_PYMUPDF = True
-except ImportError:
-    HAS_PYMUPDF = False
 
-try:
-    import pdfplumber
+def _is_installed(module_name: str) -> bool:
+    """Check whether a module is importable without importing it."""
+    return module_name in sys.modules or find_spec(module_name) is not None
 
-    HAS_PDFPLUMBER = True
-except ImportError:
-    HAS_PDFPLUMBER = False
+
+# Detect the optional PDF backends without importing them; their C
+# extensions are only loaded once an extractor actually runs. This only
+# checks that a module of that name exists, so a broken install (or the
+# unrelated "fitz" package) is only caught when the extractor imports it.
+HAS_PYMUPDF = _is_installed("fitz")
+HAS_PDFPLUMBER = _is_installed("pdfplumber")
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """Represents a single text block extracted from a PDF."""
 
@@ -79,7 +82,7 @@ class PDFExtractor:
         self.config = config or {}
         self.extract_metadata = self.config.get("extract_metadata", True)
 
-        if not self.pdf_path.exists():
+        if not os.access(self.pdf_path, os.F_OK):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
         if not self.pdf_path.suffix.lower() == ".pdf":
@@ -121,6 +124,13 @@ class PyMuPDFExtractor(PDFExtractor):
         """
         logger.info(f"Extracting PDF using PyMuPDF: {self.pdf_path}")
 
+        try:
+            import fitz  # pymupdf
+        except ImportError as e:
+            raise ImportError(
+                "pymupdf is not installed. Install with: pip install pymupdf"
+            ) from e
+
         try:
             self.doc = fitz.open(str(self.pdf_path))
             text_blocks = []
@@ -334,8 +344,7 @@ class ExtractionPhase:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(report, str(output_file))
 
         logger.info(f"Extraction report saved to: {output_path}")
 
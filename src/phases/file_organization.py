@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+from src.utils.json_io import write_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -361,8 +363,7 @@ class FileOrganizationPhase:
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            write_json(report, str(output_file))
             logger.info(f"Organization report saved to: {output_path}")
         except Exception as e:
             logger.error(f"Failed to save organization report: {e}")
@@ -1,12 +1,71 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+import hashlib
 import logging
 import re
+import sys
 from datetime import datetime
 
+from src.utils.json_io import read_json, write_json
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever classification or the cache file layout changes, so results
+# cached by an older version are never served
+STRUCTURE_CACHE_VERSION = 2
+
+
+# Constructs that stop a pattern from being embedded in a larger regex:
+# numbered backreferences and any "(?" group other than non-capturing,
+# lookaround or named groups (inline flags, (?P=name), conditionals)
+_UNFUSABLE_RE = re.compile(r"\\\d|\(\?(?![:=!]|<[=!]|P<)")
+_HEADING_GROUPS = frozenset(("part", "chapter"))
+
+
+def _can_fuse(regex: re.Pattern) -> bool:
+    """Check whether a compiled pattern keeps its meaning inside a named group."""
+    return not (
+        _HEADING_GROUPS.intersection(regex.groupindex)
+        or _UNFUSABLE_RE.search(regex.pattern)
+    )
+
+
+@lru_cache(maxsize=8)
+def _compile_heading_patterns(
+    part_pattern: str, chapter_pattern: str
+) -> Tuple[re.Pattern, re.Pattern, Optional[re.Pattern]]:
+    """
+    Compile part/chapter patterns, reusing them across phase instances.
+
+    When both patterns are safe to embed and share no group names, they are
+    also fused into one (?P<part>...)|(?P<chapter>...) alternation so a
+    single match() classifies a block and m.lastgroup names the heading.
+    Otherwise the fused pattern is None and callers match the two patterns
+    in turn.
+    """
+    part_regex = re.compile(part_pattern, re.UNICODE)
+    chapter_regex = re.compile(chapter_pattern, re.UNICODE)
+
+    fused_regex = None
+    if (
+        _can_fuse(part_regex)
+        and _can_fuse(chapter_regex)
+        and not part_regex.groupindex.keys() & chapter_regex.groupindex.keys()
+    ):
+        try:
+            fused_regex = re.compile(
+                f"(?P<part>{part_pattern})|(?P<chapter>{chapter_pattern})",
+                re.UNICODE,
+            )
+        except re.error:
+            # Anything the checks above missed still has a working fallback
+            fused_regex = None
+
+    return part_regex, chapter_regex, fused_regex
+
 
 class TextBlockType(Enum):
     """Classification of text block types."""
@@ -16,7 +75,7 @@ class TextBlockType(Enum):
     BODY_TEXT = "BODY_TEXT"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StructuredTextBlock:
     """Text block with structural classification."""
 
@@ -52,6 +111,19 @@ class StructurePhase:
             "chapter_pattern", r"^(درس)\s+([۰-۹]+)\s*[:]*\s*(.*)$"
         )
 
+        # Compile patterns once per process instead of per block
+        (
+            self.part_regex,
+            self.chapter_regex,
+            self.heading_regex,
+        ) = _compile_heading_patterns(self.part_pattern, self.chapter_pattern)
+
+        # Optional on-disk cache of results, keyed by input content hash
+        self.use_cache = self.config.get("structure_cache", False)
+        self.cache_dir = Path(
+            self.config.get("structure_cache_dir", ".cache/structure")
+        )
+
     def run(
         self,
         text_blocks: List[Dict[str, Any]],
@@ -60,36 +132,63 @@ class StructurePhase:
         """Run structure analysis phase."""
         logger.info("Starting structure analysis phase")
 
+        cache_file = None
+        if self.use_cache:
+            cache_file = self.cache_dir / f"{self._cache_key(text_blocks)}.json"
+            cached = self._load_cache(cache_file)
+            if cached is not None:
+                return cached
+
+        # Bind loop invariants to locals for cheaper lookups per block
+        heading_match = self.heading_regex.match if self.heading_regex else None
+        part_match = self.part_regex.match
+        chapter_match = self.chapter_regex.match
+        PART = TextBlockType.PART_HEADING
+        CHAPTER = TextBlockType.CHAPTER_HEADING
+        BODY = TextBlockType.BODY_TEXT
+
         structured_blocks = []
         current_part = None
         current_chapter = None
         parts_count = 0
         chapters_count = 0
 
+        # Headings are interned: one string object is shared by the heading
+        # block and every body block that references it
         for block in text_blocks:
             content = block.get("content", "").strip()
             if not content:
                 continue
 
+            # Part is checked before chapter on both paths
+            if heading_match is not None:
+                match = heading_match(content)
+                heading = match.lastgroup if match else None
+            elif part_match(content):
+                heading = "part"
+            elif chapter_match(content):
+                heading = "chapter"
+            else:
+                heading = None
+
             # Check if it's a part heading
-            part_match = re.match(self.part_pattern, content, re.UNICODE)
-            if part_match:
-                current_part = content
+            if heading == "part":
+                content = current_part = sys.intern(content)
                 current_chapter = None
                 parts_count += 1
-                block_type = TextBlockType.PART_HEADING
+                block_type = PART
                 hierarchy_level = 0
                 parent_heading = None
             # Check if it's a chapter heading
-            elif re.match(self.chapter_pattern, content, re.UNICODE):
-                current_chapter = content
+            elif heading == "chapter":
+                content = current_chapter = sys.intern(content)
                 chapters_count += 1
-                block_type = TextBlockType.CHAPTER_HEADING
+                block_type = CHAPTER
                 hierarchy_level = 1
                 parent_heading = current_part
             # Otherwise it's body text
             else:
-                block_type = TextBlockType.BODY_TEXT
+                block_type = BODY
                 hierarchy_level = 2
                 parent_heading = current_chapter or current_part
 
@@ -115,4 +214,100 @@ class StructurePhase:
             f"Structure analysis complete: {parts_count} parts, {chapters_count} chapters"
         )
 
+        if cache_file is not None:
+            self._save_cache(cache_file, (structured_blocks, metadata))
+
         return structured_blocks, metadata
+
+    def save_structure_report(
+        self, metadata: StructureMetadata, output_path: str
+    ) -> None:
+        """
+        Save structure metadata to a JSON report.
+
+        Args:
+            metadata: Structure metadata
+            output_path: Path to save the report
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        write_json(asdict(metadata), str(output_file))
+
+        logger.info(f"Structure report saved to: {output_path}")
+
+    def _cache_key(self, text_blocks: List[Dict[str, Any]]) -> str:
+        """Hash the patterns and block fields that determine the result."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"v{STRUCTURE_CACHE_VERSION}".encode("utf-8") + b"\x00")
+        hasher.update(self.part_pattern.encode("utf-8") + b"\x00")
+        hasher.update(self.chapter_pattern.encode("utf-8") + b"\x00")
+
+        for block in text_blocks:
+            content = block.get("content", "")
+            hasher.update(
+                f"{block.get('page_num', 0)}:{len(content)}:{content}".encode("utf-8")
+            )
+
+        return hasher.hexdigest()
+
+    def _load_cache(
+        self, cache_file: Path
+    ) -> Optional[Tuple[List[StructuredTextBlock], StructureMetadata]]:
+        """Load a cached structure analysis result, if present."""
+        if not cache_file.exists():
+            return None
+
+        try:
+            data = read_json(str(cache_file))
+            structured_blocks = [
+                StructuredTextBlock(
+                    content=block["content"],
+                    page_num=block["page_num"],
+                    block_type=TextBlockType(block["block_type"]),
+                    hierarchy_level=block["hierarchy_level"],
+                    parent_heading=block["parent_heading"],
+                )
+                for block in data["blocks"]
+            ]
+            # The timestamp records when this analysis ran, not the original one
+            metadata = StructureMetadata(
+                **data["metadata"], analysis_timestamp=datetime.now().isoformat()
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load structure cache {cache_file}: {e}")
+            return None
+
+        logger.info(f"Structure analysis loaded from cache: {cache_file}")
+        return structured_blocks, metadata
+
+    def _save_cache(
+        self,
+        cache_file: Path,
+        result: Tuple[List[StructuredTextBlock], StructureMetadata],
+    ) -> None:
+        """Persist a structure analysis result to the cache directory."""
+        structured_blocks, metadata = result
+        data = {
+            "blocks": [
+                {
+                    "content": block.content,
+                    "page_num": block.page_num,
+                    "block_type": block.block_type.value,
+                    "hierarchy_level": block.hierarchy_level,
+                    "parent_heading": block.parent_heading,
+                }
+                for block in structured_blocks
+            ],
+            "metadata": {
+                key: value
+                for key, value in asdict(metadata).items()
+                if key != "analysis_timestamp"
+            },
+        }
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_json(data, str(cache_file))
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write structure cache {cache_file}: {e}")
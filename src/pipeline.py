@@ -30,9 +30,23 @@ class PipelineResult:
         self.cleaning = cleaning_metadata
         self.chunking = chunking_metadata
         self.organization = organization_metadata
+        self._summary: Optional[Dict[str, Any]] = None
 
     def summary(self) -> Dict[str, Any]:
-        """Get summary of pipeline execution."""
+        """
+        Get summary of pipeline execution.
+
+        The summary is built once and cached, but each call returns a fresh
+        copy of the outer and per-phase dicts, so callers may modify the
+        result without affecting later calls.
+        """
+        if self._summary is None:
+            self._summary = self._build_summary()
+
+        return {phase: dict(stats) for phase, stats in self._summary.items()}
+
+    def _build_summary(self) -> Dict[str, Any]:
+        """Collect the per-phase summary statistics."""
         return {
             "extraction": {
                 "total_pages": self.extraction.total_pages,
@@ -0,0 +1,58 @@
+"""
+JSON serialization helpers.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def read_json(input_path: str) -> Any:
+    """
+    Read and parse a UTF-8 JSON file.
+
+    Uses orjson when it is installed and falls back to the standard
+    library decoder otherwise. Invalid JSON raises json.JSONDecodeError in
+    both cases (orjson's error type subclasses it).
+
+    Args:
+        input_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    if HAS_ORJSON:
+        return orjson.loads(Path(input_path).read_bytes())
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(data: Any, output_path: str) -> None:
+    """
+    Write data to a UTF-8 JSON file with 2-space indentation.
+
+    Uses orjson when it is installed and falls back to the standard
+    library encoder otherwise. Non-ASCII text is written unescaped either way.
+
+    Args:
+        data: JSON-serializable data
+        output_path: Path to write the JSON file to
+    """
+    output_file = Path(output_path)
+
+    if HAS_ORJSON:
+        output_file.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
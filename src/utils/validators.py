@@ -3,12 +3,43 @@ Input validation utilities.
 """
 
 import logging
-from pathlib import Path
+import os
+import re
+import stat
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, Set
 
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive suffix patterns, compiled once at import
+_PDF_RE = re.compile(r"\.pdf\Z", re.IGNORECASE)
+_JSON_RE = re.compile(r"\.json\Z", re.IGNORECASE)
 
+# Absolute paths of parent directories already confirmed to exist. Only
+# positive results are kept so a parent created later is picked up.
+_existing_parents: Set[str] = set()
+_existing_parents_lock = threading.Lock()
+
+
+def _parent_dir_exists(parent: str) -> bool:
+    """Check that a parent directory exists, remembering ones already seen."""
+    key = os.path.abspath(parent)
+
+    with _existing_parents_lock:
+        if key in _existing_parents:
+            return True
+
+    if not os.path.isdir(key):
+        return False
+
+    with _existing_parents_lock:
+        _existing_parents.add(key)
+    return True
+
+
+@lru_cache(maxsize=256)
 def validate_pdf_path(pdf_path: str) -> None:
     """
     Validate that the PDF path exists and is a valid PDF file.
@@ -18,45 +49,117 @@ def validate_pdf_path(pdf_path: str) -> None:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValueError: If file is not a PDF
+        ValueError: If file is not a PDF, or the path cannot be accessed
+            (for example, permission denied)
     """
-    path = Path(pdf_path)
-
-    if not path.exists():
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
-    if not path.is_file():
+    # A single stat() answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(pdf_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}") from None
+    except OSError as e:
+        raise ValueError(f"Cannot access PDF path: {pdf_path} ({e})") from e
+
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Path is not a file: {pdf_path}")
 
-    if path.suffix.lower() != ".pdf":
+    if not _PDF_RE.search(os.fspath(pdf_path)):
         raise ValueError(f"File is not a PDF: {pdf_path}")
 
-    logger.debug(f"PDF validation passed: {pdf_path}")
+    logger.debug("PDF validation passed: %s", pdf_path)
+
+
+def validate_pdf_paths(pdf_paths: Iterable[str]) -> None:
+    """
+    Validate many PDF paths, listing each parent directory only once.
+
+    Equivalent to calling validate_pdf_path on every path in order, but
+    paths that share a directory are checked against a single scandir()
+    of that directory instead of one stat() each. Paths the listing cannot
+    confirm as regular files (a trailing separator, a name missing from
+    the listing such as a different case on a case-insensitive filesystem,
+    broken symlinks, directories) fall back to validate_pdf_path, so they
+    raise the same errors.
+
+    Args:
+        pdf_paths: Paths to PDF files
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist
+        ValueError: If a path is not a file or not a PDF, or cannot be
+            accessed (for example, permission denied)
+    """
+    # Directory -> {entry name: is regular file}
+    listings: Dict[str, Dict[str, bool]] = {}
+
+    for pdf_path in pdf_paths:
+        pdf_path = os.fspath(pdf_path)
+        directory, name = os.path.split(pdf_path)
+        if not name:
+            validate_pdf_path(pdf_path)
+            continue
+
+        directory = directory or "."
+
+        if directory not in listings:
+            try:
+                with os.scandir(directory) as entries:
+                    listings[directory] = {
+                        entry.name: entry.is_file() for entry in entries
+                    }
+            except OSError:
+                # Unlistable (missing, not a directory, no read permission):
+                # every path in it falls back to validate_pdf_path
+                listings[directory] = {}
+
+        if not listings[directory].get(name):
+            validate_pdf_path(pdf_path)
+            continue
+
+        if not _PDF_RE.search(pdf_path):
+            raise ValueError(f"File is not a PDF: {pdf_path}")
+
+    logger.debug("PDF batch validation passed")
 
 
 def validate_output_dir(output_dir: str) -> None:
     """
     Validate that the output directory path is valid.
 
+    Not memoized: the output path is checked right before writing, so a file
+    created there since the last call must still be caught. Known-existing
+    parent directories are remembered instead.
+
     Args:
         output_dir: Path to output directory
 
     Raises:
         ValueError: If path is invalid
     """
-    path = Path(output_dir)
+    output_dir = os.fspath(output_dir)
+
+    # Same result as Path(output_dir).parent without building a Path object
+    parent = os.path.dirname(output_dir.rstrip(os.sep) or os.sep) or "."
 
-    # Check if parent directory exists
-    if not path.parent.exists():
-        raise ValueError(f"Parent directory does not exist: {path.parent}")
+    # Check if parent directory exists (the root is its own parent)
+    if parent != output_dir and not _parent_dir_exists(parent):
+        raise ValueError(f"Parent directory does not exist: {parent}")
 
     # Check if path exists and is not a directory
-    if path.exists() and not path.is_dir():
-        raise ValueError(f"Output path exists but is not a directory: {output_dir}")
+    try:
+        st = os.stat(output_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    else:
+        if not stat.S_ISDIR(st.st_mode):
+            raise ValueError(
+                f"Output path exists but is not a directory: {output_dir}"
+            )
 
-    logger.debug(f"Output directory validation passed: {output_dir}")
+    logger.debug("Output directory validation passed: %s", output_dir)
 
 
+@lru_cache(maxsize=256)
 def validate_config_path(config_path: str) -> None:
     """
     Validate that the config file path exists and is a JSON file.
@@ -66,17 +169,35 @@ def validate_config_path(config_path: str) -> None:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValueError: If file is not a JSON file
+        ValueError: If file is not a JSON file, or the path cannot be accessed
+            (for example, permission denied)
     """
-    path = Path(config_path)
-
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
-    if not path.is_file():
+    try:
+        st = os.stat(config_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    except OSError as e:
+        raise ValueError(f"Cannot access config path: {config_path} ({e})") from e
+
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Config path is not a file: {config_path}")
 
-    if path.suffix.lower() != ".json":
+    if not _JSON_RE.search(os.fspath(config_path)):
         raise ValueError(f"Config file must be JSON: {config_path}")
 
-    logger.debug(f"Config validation passed: {config_path}")
+    logger.debug("Config validation passed: %s", config_path)
+
+
+def invalidate() -> None:
+    """
+    Forget all cached validation results.
+
+    Successful PDF and config validations and known-existing output parents
+    are memoized, so call this when files or directories may have been moved
+    or deleted since they were last validated.
+    """
+    validate_pdf_path.cache_clear()
+    validate_config_path.cache_clear()
+
+    with _existing_parents_lock:
+        _existing_parents.clear()
@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def empty_pdf(tmp_path_factory):
+    """Path to an empty .pdf file shared by tests that only need a dummy PDF."""
+    pdf_path = tmp_path_factory.mktemp("pdf") / "empty.pdf"
+    pdf_path.touch()
+    return str(pdf_path)
@@ -5,6 +5,7 @@ Tests for configuration management.
 import pytest
 import json
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 
 from src.config import (
@@ -18,15 +19,40 @@ from src.config import (
 )
 
 
+@pytest.mark.parametrize(
+    "config_cls, expected",
+    [
+        (ExtractionConfig, {"library": "pymupdf", "extract_metadata": True}),
+        (
+            StructureConfig,
+            {
+                "use_bookmarks": True,
+                "use_heuristics": True,
+                "use_regex": True,
+                "font_size_threshold": 14.0,
+            },
+        ),
+        (CleaningConfig, {"crop_bottom_percent": 5.0}),
+        (
+            ChunkingConfig,
+            {"max_chunk_size": 800, "chunk_overlap": 0, "split_by_paragraph": True},
+        ),
+        (
+            OutputConfig,
+            {"output_dir": "output/", "create_metadata": True, "create_index": True},
+        ),
+    ],
+)
+def test_default_config_values(config_cls, expected):
+    """Test default values of the per-phase config dataclasses."""
+    config = config_cls()
+    for name, value in expected.items():
+        assert getattr(config, name) == value, name
+
+
 class TestExtractionConfig:
     """Test ExtractionConfig dataclass."""
 
-    def test_default_extraction_config(self):
-        """Test default extraction configuration."""
-        config = ExtractionConfig()
-        assert config.library == "pymupdf"
-        assert config.extract_metadata is True
-
     def test_custom_extraction_config(self):
         """Test custom extraction configuration."""
         config = ExtractionConfig(library="pdfplumber", extract_metadata=False)
@@ -34,27 +60,14 @@ class TestExtractionConfig:
         assert config.extract_metadata is False
 
 
-class TestStructureConfig:
-    """Test StructureConfig dataclass."""
-
-    def test_default_structure_config(self):
-        """Test default structure configuration."""
-        config = StructureConfig()
-        assert config.use_bookmarks is True
-        assert config.use_heuristics is True
-        assert config.use_regex is True
-        assert config.font_size_threshold == 14.0
-
-
 class TestCleaningConfig:
     """Test CleaningConfig dataclass."""
 
-    def test_default_cleaning_config(self):
-        """Test default cleaning configuration."""
+    def test_default_cleaning_excludes(self):
+        """Test that default cleaning configuration excludes something."""
         config = CleaningConfig()
         assert len(config.exclude_sections) > 0
         assert len(config.exclude_patterns) > 0
-        assert config.crop_bottom_percent == 5.0
 
     def test_custom_cleaning_config(self):
         """Test custom cleaning configuration."""
@@ -67,28 +80,6 @@ class TestCleaningConfig:
         assert config.crop_bottom_percent == 10.0
 
 
-class TestChunkingConfig:
-    """Test ChunkingConfig dataclass."""
-
-    def test_default_chunking_config(self):
-        """Test default chunking configuration."""
-        config = ChunkingConfig()
-        assert config.max_chunk_size == 800
-        assert config.chunk_overlap == 0
-        assert config.split_by_paragraph is True
-
-
-class TestOutputConfig:
-    """Test OutputConfig dataclass."""
-
-    def test_default_output_config(self):
-        """Test default output configuration."""
-        config = OutputConfig()
-        assert config.output_dir == "output/"
-        assert config.create_metadata is True
-        assert config.create_index is True
-
-
 class TestPipelineConfig:
     """Test PipelineConfig dataclass."""
 
@@ -155,24 +146,23 @@ class TestConfigManager:
         finally:
             Path(temp_path).unlink()
 
-    def test_save_config(self):
+    def test_save_config(self, tmp_path):
         """Test saving configuration to file."""
         config = PipelineConfig()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            ConfigManager.save_config(config, str(config_path))
+        config_path = tmp_path / "config.json"
+        ConfigManager.save_config(config, str(config_path))
 
-            assert config_path.exists()
+        assert config_path.exists()
 
-            with open(config_path, "r") as f:
-                saved_dict = json.load(f)
+        with open(config_path, "r") as f:
+            saved_dict = json.load(f)
 
-            assert "extraction" in saved_dict
-            assert "structure" in saved_dict
-            assert "cleaning" in saved_dict
-            assert "chunking" in saved_dict
-            assert "output" in saved_dict
+        assert "extraction" in saved_dict
+        assert "structure" in saved_dict
+        assert "cleaning" in saved_dict
+        assert "chunking" in saved_dict
+        assert "output" in saved_dict
 
     def test_dict_to_config(self):
         """Test converting dictionary to PipelineConfig."""
@@ -182,8 +172,11 @@ class TestConfigManager:
         }
 
         config = ConfigManager._dict_to_config(config_dict)
-        assert config.extraction.library == "pdfplumber"
-        assert config.chunking.max_chunk_size == 1000
+        expected = PipelineConfig(
+            extraction=ExtractionConfig(library="pdfplumber"),
+            chunking=ChunkingConfig(max_chunk_size=1000),
+        )
+        assert asdict(config) == asdict(expected)
 
     def test_get_default_config_json(self):
         """Test getting default configuration as JSON."""
@@ -196,17 +189,15 @@ class TestConfigManager:
         assert "chunking" in config_dict
         assert "output" in config_dict
 
-    def test_save_and_load_config_roundtrip(self):
+    def test_save_and_load_config_roundtrip(self, tmp_path):
         """Test saving and loading configuration maintains data."""
         original_config = PipelineConfig(
             extraction=ExtractionConfig(library="pdfplumber"),
             output=OutputConfig(output_dir="test_output/"),
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            ConfigManager.save_config(original_config, str(config_path))
-            loaded_config = ConfigManager.load_config(str(config_path))
+        config_path = tmp_path / "config.json"
+        ConfigManager.save_config(original_config, str(config_path))
+        loaded_config = ConfigManager.load_config(str(config_path))
 
-            assert loaded_config.extraction.library == "pdfplumber"
-            assert loaded_config.output.output_dir == "test_output/"
+        assert asdict(loaded_config) == asdict(original_config)
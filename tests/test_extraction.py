@@ -6,7 +6,7 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 
 from src.phases.extraction import (
     TextBlock,
@@ -21,6 +21,53 @@ from src.phases.extraction import (
 )
 
 
+# Result of page.get_text("dict") for a page with a single text span
+_MOCK_PAGE_DICT = {
+    "blocks": [
+        {
+            "type": 0,
+            "lines": [
+                {
+                    "spans": [
+                        {
+                            "text": "Sample text",
+                            "font": "Arial",
+                            "size": 12,
+                            "bbox": (10, 20, 100, 30),
+                        }
+                    ]
+                }
+            ],
+        }
+    ]
+}
+
+
+class _FakePage:
+    """Minimal stand-in for a fitz page."""
+
+    def get_text(self, option):
+        return _MOCK_PAGE_DICT
+
+
+class _FakeDoc:
+    """Minimal one-page stand-in for a fitz document."""
+
+    _page = _FakePage()
+
+    def __len__(self):
+        return 1
+
+    def __getitem__(self, index):
+        return self._page
+
+    def get_toc(self):
+        return []
+
+    def close(self):
+        pass
+
+
 class TestTextBlock:
     """Test the TextBlock dataclass."""
 
@@ -81,17 +128,11 @@ class TestExtractionMetadata:
 class TestPDFExtractor:
     """Test the base PDFExtractor class."""
 
-    def test_extractor_initialization_with_valid_pdf(self):
+    def test_extractor_initialization_with_valid_pdf(self, empty_pdf):
         """Test initializing extractor with valid PDF path."""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            extractor = PDFExtractor(tmp_path)
-            assert extractor.pdf_path.exists()
-            assert extractor.pdf_path.suffix == ".pdf"
-        finally:
-            Path(tmp_path).unlink()
+        extractor = PDFExtractor(empty_pdf)
+        assert extractor.pdf_path.exists()
+        assert extractor.pdf_path.suffix == ".pdf"
 
     def test_extractor_initialization_with_missing_file(self):
         """Test initializing extractor with non-existent file."""
@@ -121,33 +162,21 @@ class TestPDFExtractor:
         result = extractor._sanitize_text("  Hello World  ")
         assert result == "Hello World"
 
-    def test_extract_not_implemented(self):
+    def test_extract_not_implemented(self, empty_pdf):
         """Test that extract() raises NotImplementedError."""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            extractor = PDFExtractor(tmp_path)
-            with pytest.raises(NotImplementedError):
-                extractor.extract()
-        finally:
-            Path(tmp_path).unlink()
+        extractor = PDFExtractor(empty_pdf)
+        with pytest.raises(NotImplementedError):
+            extractor.extract()
 
 
 @pytest.mark.skipif(not HAS_PYMUPDF, reason="pymupdf not installed")
 class TestPyMuPDFExtractor:
     """Test the PyMuPDF extractor."""
 
-    def test_extractor_initialization(self):
+    def test_extractor_initialization(self, empty_pdf):
         """Test initializing PyMuPDF extractor."""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            extractor = PyMuPDFExtractor(tmp_path)
-            assert extractor.pdf_path.exists()
-        finally:
-            Path(tmp_path).unlink()
+        extractor = PyMuPDFExtractor(empty_pdf)
+        assert extractor.pdf_path.exists()
 
     def test_get_timestamp(self):
         """Test timestamp generation."""
@@ -160,16 +189,10 @@ class TestPyMuPDFExtractor:
 class TestPDFPlumberExtractor:
     """Test the pdfplumber extractor."""
 
-    def test_extractor_initialization(self):
+    def test_extractor_initialization(self, empty_pdf):
         """Test initializing pdfplumber extractor."""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            extractor = PDFPlumberExtractor(tmp_path)
-            assert extractor.pdf_path.exists()
-        finally:
-            Path(tmp_path).unlink()
+        extractor = PDFPlumberExtractor(empty_pdf)
+        assert extractor.pdf_path.exists()
 
     def test_get_bbox(self):
         """Test bounding box calculation."""
@@ -217,7 +240,7 @@ class TestExtractionPhase:
             with pytest.raises(ImportError):
                 ExtractionPhase(config)
 
-    def test_save_extraction_report(self):
+    def test_save_extraction_report(self, tmp_path):
         """Test saving extraction report."""
         metadata = ExtractionMetadata(
             source_pdf="test.pdf",
@@ -229,37 +252,30 @@ class TestExtractionPhase:
             has_bookmarks=False,
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            report_path = Path(tmpdir) / "report.json"
+        report_path = tmp_path / "report.json"
 
-            if HAS_PYMUPDF:
-                phase = ExtractionPhase()
-                phase.save_extraction_report(metadata, str(report_path))
+        if HAS_PYMUPDF:
+            phase = ExtractionPhase()
+            phase.save_extraction_report(metadata, str(report_path))
 
-                assert report_path.exists()
+            assert report_path.exists()
 
-                with open(report_path, "r") as f:
-                    report = json.load(f)
+            with open(report_path, "r") as f:
+                report = json.load(f)
 
-                assert report["source_pdf"] == "test.pdf"
-                assert report["total_pages"] == 10
-                assert report["total_blocks"] == 50
+            assert report["source_pdf"] == "test.pdf"
+            assert report["total_pages"] == 10
+            assert report["total_blocks"] == 50
 
 
 class TestFactoryFunction:
     """Test the factory function."""
 
-    def test_create_extractor(self):
+    def test_create_extractor(self, empty_pdf):
         """Test creating extractor via factory function."""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            if HAS_PYMUPDF:
-                phase = create_extractor(tmp_path)
-                assert isinstance(phase, ExtractionPhase)
-        finally:
-            Path(tmp_path).unlink()
+        if HAS_PYMUPDF:
+            phase = create_extractor(empty_pdf)
+            assert isinstance(phase, ExtractionPhase)
 
 
 class TestExtractionIntegration:
@@ -273,36 +289,7 @@ class TestExtractionIntegration:
 
         try:
             with patch("fitz.open") as mock_open:
-                # Create mock document
-                mock_doc = MagicMock()
-                mock_doc.__len__ = MagicMock(return_value=1)
-                mock_doc.__getitem__ = MagicMock()
-
-                # Create mock page
-                mock_page = MagicMock()
-                mock_page.get_text.return_value = {
-                    "blocks": [
-                        {
-                            "type": 0,
-                            "lines": [
-                                {
-                                    "spans": [
-                                        {
-                                            "text": "Sample text",
-                                            "font": "Arial",
-                                            "size": 12,
-                                            "bbox": (10, 20, 100, 30),
-                                        }
-                                    ]
-                                }
-                            ],
-                        }
-                    ]
-                }
-
-                mock_doc.__getitem__.return_value = mock_page
-                mock_doc.get_toc.return_value = []
-                mock_open.return_value = mock_doc
+                mock_open.return_value = _FakeDoc()
 
                 extractor = PyMuPDFExtractor(tmp_path)
                 blocks, metadata = extractor.extract()
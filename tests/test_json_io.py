@@ -0,0 +1,92 @@
+"""
+Tests for JSON serialization helpers.
+"""
+
+import pytest
+import json
+
+from src.utils import json_io
+from src.utils.json_io import read_json, write_json
+
+
+SAMPLE_DATA = {
+    "title": "فصل ۱: آغاز",
+    "pages": [1, 2, 3],
+    "nested": {"empty_list": [], "empty_dict": {}, "flag": True, "none": None},
+    "ratio": 0.5,
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test with orjson enabled and with the stdlib fallback."""
+    if request.param and not json_io.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(json_io, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestWriteJson:
+    """Test write_json."""
+
+    def test_roundtrip(self, backend, tmp_path):
+        """Test that written data reads back unchanged."""
+        output_path = tmp_path / "data.json"
+        write_json(SAMPLE_DATA, str(output_path))
+
+        assert json.loads(output_path.read_bytes()) == SAMPLE_DATA
+
+    def test_non_ascii_written_unescaped(self, backend, tmp_path):
+        """Test that non-ASCII text is written as UTF-8, not \\u escapes."""
+        output_path = tmp_path / "data.json"
+        write_json({"title": "فصل"}, str(output_path))
+
+        assert "فصل" in output_path.read_text(encoding="utf-8")
+
+    def test_int_keys_written_as_strings(self, backend, tmp_path):
+        """Test that integer keys become JSON string keys."""
+        output_path = tmp_path / "data.json"
+        write_json({1: "one", 2: "two"}, str(output_path))
+
+        assert json.loads(output_path.read_bytes()) == {"1": "one", "2": "two"}
+
+    @pytest.mark.skipif(not json_io.HAS_ORJSON, reason="orjson is not installed")
+    def test_orjson_and_stdlib_output_identical(self, tmp_path, monkeypatch):
+        """Test that both backends write byte-identical files."""
+        data = dict(SAMPLE_DATA, by_page={1: "فصل", 2: "درس"})
+        orjson_path = tmp_path / "orjson.json"
+        stdlib_path = tmp_path / "stdlib.json"
+
+        monkeypatch.setattr(json_io, "HAS_ORJSON", True)
+        write_json(data, str(orjson_path))
+        monkeypatch.setattr(json_io, "HAS_ORJSON", False)
+        write_json(data, str(stdlib_path))
+
+        assert orjson_path.read_bytes() == stdlib_path.read_bytes()
+
+
+class TestReadJson:
+    """Test read_json."""
+
+    def test_read(self, backend, tmp_path):
+        """Test reading a UTF-8 JSON file."""
+        input_path = tmp_path / "data.json"
+        input_path.write_text(
+            json.dumps(SAMPLE_DATA, ensure_ascii=False), encoding="utf-8"
+        )
+
+        assert read_json(str(input_path)) == SAMPLE_DATA
+
+    @pytest.mark.parametrize("content", ["", "{ invalid json }", '{"a": 1,}'])
+    def test_invalid_json(self, backend, tmp_path, content):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        input_path = tmp_path / "data.json"
+        input_path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            read_json(str(input_path))
+
+    def test_missing_file(self, backend, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            read_json(str(tmp_path / "missing.json"))
@@ -3,14 +3,59 @@ Tests for the main module.
 """
 
 import pytest
-import tempfile
 import json
+import logging
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from src.main import setup_argument_parser, configure_logging, run_pipeline
 
 
+@dataclass
+class _FakeMetadata:
+    """Subset of ExtractionMetadata read by run_pipeline."""
+
+    total_blocks: int = 100
+    total_characters: int = 10000
+    total_pages: int = 10
+
+
+class _FakeExtractionPhase:
+    """Stand-in for ExtractionPhase that records the PDFs it is run on."""
+
+    def __init__(self, config=None, metadata=None):
+        self.config = config
+        self.metadata = metadata or _FakeMetadata()
+        self.run_calls = []
+
+    def run(self, pdf_path):
+        self.run_calls.append(pdf_path)
+        return [], self.metadata
+
+    def save_extraction_report(self, metadata, output_path):
+        Path(output_path).write_text("{}")
+
+
+@pytest.fixture
+def fake_extraction_phases(request, monkeypatch):
+    """
+    Replace ExtractionPhase in src.main and collect the instances created.
+
+    Parametrize indirectly with a _FakeMetadata to change what run() returns.
+    """
+    phases = []
+    metadata = getattr(request, "param", None)
+
+    def make_phase(config=None):
+        phase = _FakeExtractionPhase(config, metadata)
+        phases.append(phase)
+        return phase
+
+    monkeypatch.setattr("src.main.ExtractionPhase", make_phase)
+    return phases
+
+
 class TestArgumentParser:
     """Test command-line argument parser."""
 
@@ -59,6 +104,22 @@ class TestArgumentParser:
         assert args.show_config is True
 
 
+@pytest.fixture
+def restore_root_logging():
+    """Snapshot the root logger's level and handlers and restore them after."""
+    root = logging.getLogger()
+    level = root.level
+    handlers = root.handlers[:]
+    yield
+    for handler in root.handlers:
+        if handler not in handlers:
+            handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+@pytest.mark.xdist_group("logging")
+@pytest.mark.usefixtures("restore_root_logging")
 class TestConfigureLogging:
     """Test logging configuration."""
 
@@ -76,96 +137,67 @@ class TestConfigureLogging:
 class TestRunPipeline:
     """Test pipeline execution."""
 
-    @patch("src.main.ExtractionPhase")
     @patch("src.main.validate_pdf_path")
     @patch("src.main.validate_output_dir")
     def test_run_pipeline_success(
-        self, mock_validate_output, mock_validate_pdf, mock_extraction
+        self,
+        mock_validate_output,
+        mock_validate_pdf,
+        fake_extraction_phases,
+        empty_pdf,
+        tmp_path,
     ):
         """Test successful pipeline execution."""
-        # Setup mocks
-        mock_extraction_instance = MagicMock()
-        mock_extraction.return_value = mock_extraction_instance
-
-        mock_metadata = MagicMock()
-        mock_metadata.total_blocks = 100
-        mock_metadata.total_characters = 10000
-        mock_metadata.total_pages = 10
-
-        mock_extraction_instance.run.return_value = ([], mock_metadata)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-                pdf_path = tmp_pdf.name
-
-            try:
-                run_pipeline(
-                    input_pdf=pdf_path,
-                    output_dir=tmpdir,
-                    config_path=None,
-                    verbose=False,
-                )
-
-                # Verify extraction was called
-                mock_extraction_instance.run.assert_called_once_with(pdf_path)
+        run_pipeline(
+            input_pdf=empty_pdf,
+            output_dir=str(tmp_path),
+            config_path=None,
+            verbose=False,
+        )
 
-                # Verify config was saved
-                config_file = Path(tmpdir) / "config_used.json"
-                assert config_file.exists()
+        # Verify extraction was called
+        assert [phase.run_calls for phase in fake_extraction_phases] == [[empty_pdf]]
 
-                # Verify extraction report was saved
-                report_file = Path(tmpdir) / "extraction_report.json"
-                assert report_file.exists()
+        # Verify config was saved
+        config_file = tmp_path / "config_used.json"
+        assert config_file.exists()
 
-            finally:
-                Path(pdf_path).unlink()
+        # Verify extraction report was saved
+        report_file = tmp_path / "extraction_report.json"
+        assert report_file.exists()
 
-    @patch("src.main.ExtractionPhase")
+    @pytest.mark.parametrize(
+        "fake_extraction_phases",
+        [_FakeMetadata(total_blocks=50, total_characters=5000, total_pages=5)],
+        indirect=True,
+    )
     @patch("src.main.validate_pdf_path")
     @patch("src.main.validate_output_dir")
     def test_run_pipeline_with_config(
-        self, mock_validate_output, mock_validate_pdf, mock_extraction
+        self,
+        mock_validate_output,
+        mock_validate_pdf,
+        fake_extraction_phases,
+        empty_pdf,
+        tmp_path,
     ):
         """Test pipeline execution with custom config."""
-        # Setup mocks
-        mock_extraction_instance = MagicMock()
-        mock_extraction.return_value = mock_extraction_instance
-
-        mock_metadata = MagicMock()
-        mock_metadata.total_blocks = 50
-        mock_metadata.total_characters = 5000
-        mock_metadata.total_pages = 5
-
-        mock_extraction_instance.run.return_value = ([], mock_metadata)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-                pdf_path = tmp_pdf.name
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as tmp_config:
-                config_dict = {
-                    "extraction": {"library": "pdfplumber"},
-                    "chunking": {"max_chunk_size": 1000},
-                }
-                json.dump(config_dict, tmp_config)
-                config_path = tmp_config.name
-
-            try:
-                run_pipeline(
-                    input_pdf=pdf_path,
-                    output_dir=tmpdir,
-                    config_path=config_path,
-                    verbose=False,
-                )
-
-                # Verify extraction was called
-                mock_extraction_instance.run.assert_called_once_with(pdf_path)
-
-            finally:
-                Path(pdf_path).unlink()
-                Path(config_path).unlink()
+        config_dict = {
+            "extraction": {"library": "pdfplumber"},
+            "chunking": {"max_chunk_size": 1000},
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config_dict))
+
+        run_pipeline(
+            input_pdf=empty_pdf,
+            output_dir=str(tmp_path),
+            config_path=str(config_path),
+            verbose=False,
+        )
+
+        # Verify extraction was called
+        assert [phase.run_calls for phase in fake_extraction_phases] == [[empty_pdf]]
 
     @patch("src.main.validate_pdf_path")
     def test_run_pipeline_invalid_pdf(self, mock_validate_pdf):
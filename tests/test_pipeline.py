@@ -0,0 +1,74 @@
+"""
+Tests for the pipeline orchestrator.
+"""
+
+import pytest
+
+from src.phases.extraction import ExtractionMetadata
+from src.phases.cleaning import CleaningMetadata
+from src.phases.chunking import ChunkingMetadata
+from src.phases.file_organization import FileOrganizationMetadata
+from src.pipeline import PipelineResult
+
+
+@pytest.fixture
+def result():
+    """PipelineResult built from small, fixed per-phase metadata."""
+    return PipelineResult(
+        ExtractionMetadata(
+            source_pdf="test.pdf",
+            total_pages=10,
+            total_blocks=100,
+            total_characters=10000,
+            extraction_library="pymupdf",
+            extraction_timestamp="2024-01-01T00:00:00",
+            has_bookmarks=False,
+            bookmarks=None,
+        ),
+        CleaningMetadata(
+            total_blocks_input=100,
+            total_blocks_output=90,
+            total_characters_input=10000,
+            total_characters_output=9000,
+            blocks_removed=10,
+            characters_removed=1000,
+        ),
+        ChunkingMetadata(
+            total_chunks=12,
+            total_characters=9000,
+            avg_chunk_size=750.0,
+            min_chunk_size=200,
+            max_chunk_size=800,
+        ),
+        FileOrganizationMetadata(
+            total_chunks_saved=12,
+            total_chapters=3,
+            total_parts=1,
+            index_file_path="output/index.json",
+        ),
+    )
+
+
+class TestPipelineResult:
+    """Test PipelineResult."""
+
+    def test_summary(self, result):
+        """Test that the summary reports each phase."""
+        summary = result.summary()
+
+        assert summary["extraction"]["total_pages"] == 10
+        assert summary["cleaning"]["blocks_removed"] == 10
+        assert summary["chunking"]["total_chunks"] == 12
+        assert summary["organization"]["index_file"] == "output/index.json"
+
+    def test_summary_returns_independent_copies(self, result):
+        """Test that modifying one summary does not affect later calls."""
+        first = result.summary()
+        first.pop("cleaning")
+        first["extraction"]["extra"] = True
+
+        second = result.summary()
+
+        assert "cleaning" in second
+        assert "extra" not in second["extraction"]
+        assert second == result.summary()
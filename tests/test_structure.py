@@ -1,6 +1,6 @@
 import pytest
-import tempfile
-from pathlib import Path
+import json
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 from src.phases.extraction import TextBlock, ExtractionMetadata
 from src.phases.structure import (
@@ -17,16 +17,22 @@ from src.phases.structure import (
 class TestTextBlockType:
     """Test TextBlockType enum."""
 
-    def test_text_block_types_exist(self):
-        """Test that all required text block types exist."""
-        assert TextBlockType.PART_HEADING
-        assert TextBlockType.CHAPTER_HEADING
-        assert TextBlockType.SECTION_HEADING
-        assert TextBlockType.SUBSECTION_HEADING
-        assert TextBlockType.BODY_TEXT
-        assert TextBlockType.HEADER
-        assert TextBlockType.FOOTER
-        assert TextBlockType.UNKNOWN
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "PART_HEADING",
+            "CHAPTER_HEADING",
+            "SECTION_HEADING",
+            "SUBSECTION_HEADING",
+            "BODY_TEXT",
+            "HEADER",
+            "FOOTER",
+            "UNKNOWN",
+        ],
+    )
+    def test_text_block_type_exists(self, name):
+        """Test that a required text block type exists."""
+        assert getattr(TextBlockType, name)
 
 
 class TestStructuredTextBlock:
@@ -247,100 +253,206 @@ class TestHeuristicAnalyzer:
         assert not analyzer._is_centered(left_block)
 
 
+@pytest.fixture(scope="class")
+def regex_analyzer():
+    """RegexAnalyzer shared by all tests in a class."""
+    return RegexAnalyzer()
+
+
 class TestRegexAnalyzer:
     """Test RegexAnalyzer."""
 
-    def test_initialization(self):
+    def test_initialization(self, regex_analyzer):
         """Test regex analyzer initialization."""
-        analyzer = RegexAnalyzer()
-        assert analyzer.patterns is not None
-        assert len(analyzer.patterns) > 0
-
-    def test_analyze_chapter_pattern(self):
-        """Test analyzing chapter pattern."""
-        blocks = [
-            TextBlock(
-                content="Chapter 1: Introduction",
-                page_num=1,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                char_count=23,
-            ),
-            TextBlock(
-                content="This is body text.",
-                page_num=1,
-                x0=0,
-                y0=150,
-                x1=600,
-                y1=170,
-                char_count=18,
-            ),
-        ]
+        assert regex_analyzer.patterns is not None
+        assert len(regex_analyzer.patterns) > 0
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            ("Chapter 1: Introduction", TextBlockType.CHAPTER_HEADING),
+            ("Part I: The Beginning", TextBlockType.PART_HEADING),
+            ("1.1 Introduction", TextBlockType.SECTION_HEADING),
+            ("1.1.1 Background", TextBlockType.SUBSECTION_HEADING),
+            ("This is body text.", TextBlockType.BODY_TEXT),
+        ],
+    )
+    def test_analyze_pattern(self, regex_analyzer, content, expected):
+        """Test classifying a single block by heading pattern."""
+        block = TextBlock(
+            content=content,
+            page_num=1,
+            x0=0,
+            y0=100,
+            x1=600,
+            y1=120,
+            char_count=len(content),
+        )
 
-        analyzer = RegexAnalyzer()
-        block_types, block_to_level = analyzer.analyze(blocks)
+        block_types, _ = regex_analyzer.analyze([block])
+
+        assert block_types[0] == expected
+
+
+def _make_metadata(**overrides):
+    """Build ExtractionMetadata for a small test PDF, overriding any fields."""
+    fields = dict(
+        source_pdf="test.pdf",
+        total_pages=1,
+        total_blocks=2,
+        total_characters=30,
+        extraction_library="pymupdf",
+        extraction_timestamp="2024-01-01T00:00:00",
+        has_bookmarks=False,
+        bookmarks=None,
+    )
+    fields.update(overrides)
+    return ExtractionMetadata(**fields)
+
+
+@pytest.fixture
+def part_block():
+    """Bold "Part I" heading on page 1."""
+    return TextBlock(
+        content="Part I",
+        page_num=1,
+        x0=0,
+        y0=100,
+        x1=600,
+        y1=120,
+        font_size=20,
+        is_bold=True,
+        char_count=6,
+    )
+
+
+@pytest.fixture
+def chapter_block():
+    """Bold "Chapter 1" heading on page 5."""
+    return TextBlock(
+        content="Chapter 1",
+        page_num=5,
+        x0=0,
+        y0=100,
+        x1=600,
+        y1=120,
+        font_size=18,
+        is_bold=True,
+        char_count=9,
+    )
+
+
+@pytest.fixture
+def body_block():
+    """Plain body text on page 6."""
+    return TextBlock(
+        content="Body text here.",
+        page_num=6,
+        x0=0,
+        y0=150,
+        x1=600,
+        y1=170,
+        font_size=12,
+        char_count=15,
+    )
+
+
+@pytest.fixture
+def metadata_without_bookmarks():
+    """Extraction metadata for a PDF that has no bookmarks."""
+    return _make_metadata(total_pages=15, total_blocks=3, total_characters=26)
+
+
+@pytest.fixture
+def metadata_with_bookmarks():
+    """Extraction metadata whose bookmarks match part_block and chapter_block."""
+    return _make_metadata(
+        total_pages=10,
+        total_blocks=3,
+        has_bookmarks=True,
+        bookmarks=[
+            {"level": 0, "title": "Part I", "page": 1},
+            {"level": 1, "title": "Chapter 1", "page": 5},
+        ],
+    )
 
-        assert block_types[0] == TextBlockType.CHAPTER_HEADING
-        assert block_types[1] == TextBlockType.BODY_TEXT
 
-    def test_analyze_part_pattern(self):
-        """Test analyzing part pattern."""
-        blocks = [
-            TextBlock(
-                content="Part I: The Beginning",
-                page_num=1,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                char_count=21,
-            ),
-        ]
+@pytest.fixture
+def bookmark_blocks(part_block, chapter_block, body_block):
+    """Headings matching metadata_with_bookmarks, followed by body text."""
+    return [
+        replace(part_block, font_size=18),
+        replace(chapter_block, font_size=16),
+        body_block,
+    ]
 
-        analyzer = RegexAnalyzer()
-        block_types, block_to_level = analyzer.analyze(blocks)
 
-        assert block_types[0] == TextBlockType.PART_HEADING
+@pytest.fixture
+def heuristic_blocks():
+    """Centered bold 18pt heading followed by plain body text."""
+    return [
+        TextBlock(
+            content="Chapter 1: Introduction",
+            page_num=1,
+            x0=250,
+            y0=100,
+            x1=350,
+            y1=150,
+            font_size=18,
+            is_bold=True,
+            char_count=23,
+        ),
+        TextBlock(
+            content="This is body text.",
+            page_num=1,
+            x0=50,
+            y0=200,
+            x1=550,
+            y1=220,
+            font_size=12,
+            is_bold=False,
+            char_count=18,
+        ),
+    ]
 
-    def test_analyze_section_pattern(self):
-        """Test analyzing section pattern."""
-        blocks = [
-            TextBlock(
-                content="1.1 Introduction",
-                page_num=1,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                char_count=15,
-            ),
-        ]
 
-        analyzer = RegexAnalyzer()
-        block_types, block_to_level = analyzer.analyze(blocks)
+@pytest.fixture
+def heuristic_metadata():
+    """Extraction metadata matching heuristic_blocks."""
+    return _make_metadata(total_characters=41)
 
-        assert block_types[0] == TextBlockType.SECTION_HEADING
 
-    def test_analyze_subsection_pattern(self):
-        """Test analyzing subsection pattern."""
-        blocks = [
-            TextBlock(
-                content="1.1.1 Background",
-                page_num=1,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                char_count=15,
-            ),
-        ]
+@pytest.fixture
+def regex_blocks():
+    """Regex-shaped chapter heading in body font, followed by body text."""
+    return [
+        TextBlock(
+            content="Chapter 1: Introduction",
+            page_num=1,
+            x0=0,
+            y0=100,
+            x1=600,
+            y1=120,
+            font_size=14,
+            char_count=23,
+        ),
+        TextBlock(
+            content="Body text.",
+            page_num=1,
+            x0=0,
+            y0=150,
+            x1=600,
+            y1=170,
+            font_size=12,
+            char_count=10,
+        ),
+    ]
 
-        analyzer = RegexAnalyzer()
-        block_types, block_to_level = analyzer.analyze(blocks)
 
-        assert block_types[0] == TextBlockType.SUBSECTION_HEADING
+@pytest.fixture
+def regex_metadata():
+    """Extraction metadata matching regex_blocks."""
+    return _make_metadata(total_characters=33)
 
 
 class TestStructurePhase:
@@ -367,156 +479,52 @@ class TestStructurePhase:
         assert phase.use_heuristics is True
         assert phase.use_regex is False
 
-    def test_run_with_bookmarks(self):
+    def test_run_with_bookmarks(self, bookmark_blocks, metadata_with_bookmarks):
         """Test running structure analysis with bookmarks."""
-        text_blocks = [
-            TextBlock(
-                content="Part I",
-                page_num=1,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                font_size=18,
-                is_bold=True,
-                char_count=6,
-            ),
-            TextBlock(
-                content="Chapter 1",
-                page_num=5,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                font_size=16,
-                is_bold=True,
-                char_count=9,
-            ),
-            TextBlock(
-                content="Body text here.",
-                page_num=6,
-                x0=0,
-                y0=150,
-                x1=600,
-                y1=170,
-                font_size=12,
-                char_count=15,
-            ),
-        ]
-
-        bookmarks = [
-            {"level": 0, "title": "Part I", "page": 1},
-            {"level": 1, "title": "Chapter 1", "page": 5},
-        ]
-
-        extraction_metadata = ExtractionMetadata(
-            source_pdf="test.pdf",
-            total_pages=10,
-            total_blocks=3,
-            total_characters=30,
-            extraction_library="pymupdf",
-            extraction_timestamp="2024-01-01T00:00:00",
-            has_bookmarks=True,
-            bookmarks=bookmarks,
-        )
-
         phase = StructurePhase({"use_bookmarks": True, "use_heuristics": False})
-        structured_blocks, metadata = phase.run(text_blocks, extraction_metadata)
+        structured_blocks, metadata = phase.run(
+            bookmark_blocks, metadata_with_bookmarks
+        )
 
         assert len(structured_blocks) == 3
         assert metadata.parts_found >= 1
         assert metadata.chapters_found >= 1
-        assert "bookmarks" in metadata.structure_method
 
-    def test_run_with_heuristics_only(self):
-        """Test running structure analysis with heuristics only."""
-        text_blocks = [
-            TextBlock(
-                content="Chapter 1: Introduction",
-                page_num=1,
-                x0=250,
-                y0=100,
-                x1=350,
-                y1=150,
-                font_size=18,
-                is_bold=True,
-                char_count=23,
-            ),
-            TextBlock(
-                content="This is body text.",
-                page_num=1,
-                x0=50,
-                y0=200,
-                x1=550,
-                y1=220,
-                font_size=12,
-                is_bold=False,
-                char_count=18,
+    @pytest.mark.parametrize(
+        "flags, blocks_fixture, metadata_fixture, expected",
+        [
+            (
+                {"use_bookmarks": True, "use_heuristics": False, "use_regex": False},
+                "bookmark_blocks",
+                "metadata_with_bookmarks",
+                "bookmarks",
             ),
-        ]
-
-        extraction_metadata = ExtractionMetadata(
-            source_pdf="test.pdf",
-            total_pages=1,
-            total_blocks=2,
-            total_characters=41,
-            extraction_library="pymupdf",
-            extraction_timestamp="2024-01-01T00:00:00",
-            has_bookmarks=False,
-            bookmarks=None,
-        )
-
-        phase = StructurePhase(
-            {"use_bookmarks": False, "use_heuristics": True, "use_regex": False}
-        )
-        structured_blocks, metadata = phase.run(text_blocks, extraction_metadata)
-
-        assert len(structured_blocks) == 2
-        assert "heuristics" in metadata.structure_method
-
-    def test_run_with_regex_only(self):
-        """Test running structure analysis with regex only."""
-        text_blocks = [
-            TextBlock(
-                content="Chapter 1: Introduction",
-                page_num=1,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                font_size=14,
-                char_count=23,
+            (
+                {"use_bookmarks": False, "use_heuristics": True, "use_regex": False},
+                "heuristic_blocks",
+                "heuristic_metadata",
+                "heuristics",
             ),
-            TextBlock(
-                content="Body text.",
-                page_num=1,
-                x0=0,
-                y0=150,
-                x1=600,
-                y1=170,
-                font_size=12,
-                char_count=10,
+            (
+                {"use_bookmarks": False, "use_heuristics": False, "use_regex": True},
+                "regex_blocks",
+                "regex_metadata",
+                "regex",
             ),
-        ]
-
-        extraction_metadata = ExtractionMetadata(
-            source_pdf="test.pdf",
-            total_pages=1,
-            total_blocks=2,
-            total_characters=33,
-            extraction_library="pymupdf",
-            extraction_timestamp="2024-01-01T00:00:00",
-            has_bookmarks=False,
-            bookmarks=None,
-        )
-
-        phase = StructurePhase(
-            {"use_bookmarks": False, "use_heuristics": False, "use_regex": True}
-        )
+        ],
+    )
+    def test_structure_method_label(
+        self, request, flags, blocks_fixture, metadata_fixture, expected
+    ):
+        """Test that each method, fed input it can detect, is reported."""
+        text_blocks = request.getfixturevalue(blocks_fixture)
+        extraction_metadata = request.getfixturevalue(metadata_fixture)
+
+        phase = StructurePhase(flags)
         structured_blocks, metadata = phase.run(text_blocks, extraction_metadata)
 
-        assert len(structured_blocks) == 2
-        assert "regex" in metadata.structure_method
+        assert len(structured_blocks) == len(text_blocks)
+        assert expected in metadata.structure_method
 
     def test_run_with_combined_methods(self):
         """Test running structure analysis with all methods."""
@@ -570,13 +578,10 @@ class TestStructurePhase:
             {"level": 1, "title": "Chapter 1: Introduction", "page": 5},
         ]
 
-        extraction_metadata = ExtractionMetadata(
-            source_pdf="test.pdf",
+        extraction_metadata = _make_metadata(
             total_pages=15,
             total_blocks=4,
             total_characters=103,
-            extraction_library="pymupdf",
-            extraction_timestamp="2024-01-01T00:00:00",
             has_bookmarks=True,
             bookmarks=bookmarks,
         )
@@ -598,31 +603,13 @@ class TestStructurePhase:
         assert "heuristics" in metadata.structure_method
         assert "regex" in metadata.structure_method
 
-    def test_hierarchy_building(self):
+    def test_hierarchy_building(
+        self, part_block, chapter_block, metadata_without_bookmarks
+    ):
         """Test building document hierarchy."""
         text_blocks = [
-            TextBlock(
-                content="Part I",
-                page_num=1,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                font_size=20,
-                is_bold=True,
-                char_count=6,
-            ),
-            TextBlock(
-                content="Chapter 1",
-                page_num=5,
-                x0=0,
-                y0=100,
-                x1=600,
-                y1=120,
-                font_size=18,
-                is_bold=True,
-                char_count=9,
-            ),
+            part_block,
+            chapter_block,
             TextBlock(
                 content="Section 1.1",
                 page_num=10,
@@ -635,17 +622,7 @@ class TestStructurePhase:
                 char_count=11,
             ),
         ]
-
-        extraction_metadata = ExtractionMetadata(
-            source_pdf="test.pdf",
-            total_pages=15,
-            total_blocks=3,
-            total_characters=26,
-            extraction_library="pymupdf",
-            extraction_timestamp="2024-01-01T00:00:00",
-            has_bookmarks=False,
-            bookmarks=None,
-        )
+        extraction_metadata = metadata_without_bookmarks
 
         phase = StructurePhase({"use_regex": True})
         structured_blocks, metadata = phase.run(text_blocks, extraction_metadata)
@@ -655,7 +632,7 @@ class TestStructurePhase:
         hierarchy = metadata.hierarchy[0]
         assert hierarchy["type"] in ["part", "chapter", "section"]
 
-    def test_save_structure_report(self):
+    def test_save_structure_report(self, tmp_path):
         """Test saving structure report."""
         from src.phases.structure import StructureMetadata
 
@@ -686,23 +663,19 @@ class TestStructurePhase:
 
         phase = StructurePhase()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            report_path = Path(tmpdir) / "structure_report.json"
-            phase.save_structure_report(metadata, str(report_path))
-
-            assert report_path.exists()
+        report_path = tmp_path / "structure_report.json"
+        phase.save_structure_report(metadata, str(report_path))
 
-            import json
+        assert report_path.exists()
 
-            with open(report_path, "r") as f:
-                report = json.load(f)
+        report = json.loads(report_path.read_bytes())
 
-            assert report["total_blocks"] == 100
-            assert report["classified_blocks"] == 15
-            assert report["parts_found"] == 1
-            assert report["chapters_found"] == 5
-            assert report["sections_found"] == 9
-            assert report["structure_method"] == "bookmarks+heuristics"
+        assert report["total_blocks"] == 100
+        assert report["classified_blocks"] == 15
+        assert report["parts_found"] == 1
+        assert report["chapters_found"] == 5
+        assert report["sections_found"] == 9
+        assert report["structure_method"] == "bookmarks+heuristics"
 
 
 class TestCreateStructureAnalyzer:
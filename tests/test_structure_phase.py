@@ -0,0 +1,174 @@
+"""
+Tests for the regex-based StructurePhase.
+"""
+
+import pytest
+import json
+from dataclasses import asdict
+
+from src.phases.structure import (
+    STRUCTURE_CACHE_VERSION,
+    StructurePhase,
+    TextBlockType,
+)
+
+
+def _block_types(phase, contents):
+    """Run the phase on one block per content string and return their types."""
+    structured_blocks, _ = phase.run(
+        [{"content": content, "page_num": 1} for content in contents]
+    )
+    return [block.block_type for block in structured_blocks]
+
+
+class TestHeadingPatterns:
+    """Test part/chapter heading classification."""
+
+    def test_default_patterns(self):
+        """Test classifying Persian part and chapter headings."""
+        phase = StructurePhase()
+
+        assert phase.heading_regex is not None
+        assert _block_types(phase, ["فصل ۱: آغاز", "درس ۲ چیزی", "متن"]) == [
+            TextBlockType.PART_HEADING,
+            TextBlockType.CHAPTER_HEADING,
+            TextBlockType.BODY_TEXT,
+        ]
+
+    def test_chapter_pattern_with_backreference(self):
+        """Test that numbered backreferences keep their group numbers."""
+        phase = StructurePhase({"chapter_pattern": r"^(Ch)(\d)\2"})
+
+        assert phase.heading_regex is None
+        assert _block_types(phase, ["Ch11", "Ch12"]) == [
+            TextBlockType.CHAPTER_HEADING,
+            TextBlockType.BODY_TEXT,
+        ]
+
+    @pytest.mark.parametrize(
+        "part_pattern, chapter_pattern",
+        [
+            (r"^(P)(\d)\2", None),
+            (r"(?i)^p11", None),
+            (r"^(?P<part>P)(\d)\2", None),
+            (r"^P(?P<num>\d+)", r"^درس (?P<num>[۰-۹]+)"),
+        ],
+    )
+    def test_part_pattern_not_fusable(self, part_pattern, chapter_pattern):
+        """Test part patterns that cannot be embedded in one alternation."""
+        config = {"part_pattern": part_pattern}
+        if chapter_pattern is not None:
+            config["chapter_pattern"] = chapter_pattern
+        phase = StructurePhase(config)
+
+        assert phase.heading_regex is None
+        assert _block_types(phase, ["P11", "درس ۱"]) == [
+            TextBlockType.PART_HEADING,
+            TextBlockType.CHAPTER_HEADING,
+        ]
+
+    def test_part_checked_before_chapter(self):
+        """Test that a block matching both patterns is a part heading."""
+        phase = StructurePhase({"part_pattern": r"^Unit", "chapter_pattern": r"^U"})
+
+        assert _block_types(phase, ["Unit 1", "U 2"]) == [
+            TextBlockType.PART_HEADING,
+            TextBlockType.CHAPTER_HEADING,
+        ]
+
+
+@pytest.fixture
+def cached_phase(tmp_path):
+    """StructurePhase with the result cache enabled under tmp_path."""
+    return StructurePhase(
+        {"structure_cache": True, "structure_cache_dir": str(tmp_path / "cache")}
+    )
+
+
+@pytest.fixture
+def blocks():
+    """Part heading, chapter heading and body text."""
+    return [
+        {"content": "فصل ۱: آغاز", "page_num": 1},
+        {"content": "درس ۱", "page_num": 2},
+        {"content": "متن", "page_num": 2},
+    ]
+
+
+class TestStructureCache:
+    """Test the opt-in structure analysis result cache."""
+
+    def test_cache_miss_writes_file(self, cached_phase, blocks):
+        """Test that a first run stores its result as JSON."""
+        cached_phase.run(blocks)
+
+        cache_files = list(cached_phase.cache_dir.glob("*.json"))
+        assert len(cache_files) == 1
+
+        data = json.loads(cache_files[0].read_bytes())
+        assert len(data["blocks"]) == 3
+        assert "analysis_timestamp" not in data["metadata"]
+
+    def test_cache_hit(self, cached_phase, blocks):
+        """Test that a repeated run is served from the cache file."""
+        expected_blocks, _ = cached_phase.run(blocks)
+
+        cache_file = next(cached_phase.cache_dir.glob("*.json"))
+        data = json.loads(cache_file.read_bytes())
+        data["metadata"]["parts_found"] = 99
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        structured_blocks, metadata = cached_phase.run(blocks)
+
+        assert structured_blocks == expected_blocks
+        assert metadata.parts_found == 99
+        assert metadata.analysis_timestamp
+
+    def test_cache_miss_on_different_input(self, cached_phase, blocks):
+        """Test that changed input is analyzed again under a new key."""
+        cached_phase.run(blocks)
+        cached_phase.run(blocks[:2])
+
+        assert len(list(cached_phase.cache_dir.glob("*.json"))) == 2
+
+    def test_cache_miss_on_version_change(self, cached_phase, blocks, monkeypatch):
+        """Test that results cached by another version are not reused."""
+        cached_phase.run(blocks)
+        monkeypatch.setattr(
+            "src.phases.structure.STRUCTURE_CACHE_VERSION",
+            STRUCTURE_CACHE_VERSION + 1,
+        )
+        cached_phase.run(blocks)
+
+        assert len(list(cached_phase.cache_dir.glob("*.json"))) == 2
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"", b"{ invalid json }", b'{"blocks": []}', b'{"blocks": [{}]}'],
+    )
+    def test_corrupt_cache_file(self, cached_phase, blocks, content):
+        """Test that an unreadable cache file is ignored and rewritten."""
+        expected_blocks, expected_metadata = cached_phase.run(blocks)
+
+        cache_file = next(cached_phase.cache_dir.glob("*.json"))
+        cache_file.write_bytes(content)
+
+        structured_blocks, metadata = cached_phase.run(blocks)
+
+        assert structured_blocks == expected_blocks
+        assert metadata.parts_found == expected_metadata.parts_found
+        assert len(json.loads(cache_file.read_bytes())["blocks"]) == 3
+
+
+class TestSaveStructureReport:
+    """Test StructurePhase.save_structure_report."""
+
+    def test_save_structure_report(self, blocks, tmp_path):
+        """Test that the report holds every metadata field."""
+        phase = StructurePhase()
+        _, metadata = phase.run(blocks)
+
+        report_path = tmp_path / "reports" / "structure_report.json"
+        phase.save_structure_report(metadata, str(report_path))
+
+        assert json.loads(report_path.read_bytes()) == asdict(metadata)
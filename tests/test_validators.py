@@ -3,114 +3,284 @@ Tests for input validators.
 """
 
 import pytest
-import tempfile
+import os
+import re
+from contextlib import nullcontext
 from pathlib import Path
 
 from src.utils.validators import (
     validate_pdf_path,
+    validate_pdf_paths,
     validate_output_dir,
     validate_config_path,
+    invalidate,
 )
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_NOT_PDF = re.compile("not a PDF")
+_NOT_FILE = re.compile("not a file")
+_NOT_DIR = re.compile("not a directory")
+_MUST_BE_JSON = re.compile("must be JSON")
+_PARENT_MISSING = re.compile("Parent directory does not exist")
+_CANNOT_ACCESS = re.compile("Cannot access")
+
+# Keep the module on one worker so the module-scoped files are created once
+pytestmark = pytest.mark.xdist_group(__name__)
+
+
+@pytest.fixture(scope="module")
+def valid_pdf(tmp_path_factory):
+    """Empty .pdf file shared by the tests in this module."""
+    path = tmp_path_factory.mktemp("validators") / "sample.pdf"
+    path.write_bytes(b"")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def valid_txt(tmp_path_factory):
+    """Empty .txt file shared by the tests in this module."""
+    path = tmp_path_factory.mktemp("validators") / "sample.txt"
+    path.write_bytes(b"")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def valid_json(tmp_path_factory):
+    """Empty .json file shared by the tests in this module."""
+    path = tmp_path_factory.mktemp("validators") / "sample.json"
+    path.write_bytes(b"")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def valid_dir(tmp_path_factory):
+    """Existing directory shared by the tests in this module."""
+    return str(tmp_path_factory.mktemp("validators_dir"))
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    """Start every test with an empty validation cache."""
+    invalidate()
+    yield
+    invalidate()
+
+
+def _empty_scandir(path):
+    """os.scandir replacement that lists no entries."""
+    return nullcontext(iter(()))
+
+
+def _deny_scandir(path):
+    """os.scandir replacement that always fails with a permission error."""
+    raise PermissionError(13, "Permission denied", path)
+
+
+def _deny_stat(path):
+    """os.stat replacement that always fails with a permission error."""
+    raise PermissionError(13, "Permission denied", path)
+
 
 class TestValidatePdfPath:
     """Test PDF path validation."""
 
-    def test_valid_pdf_path(self):
+    def test_valid_pdf_path(self, valid_pdf):
         """Test validation with valid PDF path."""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
+        validate_pdf_path(valid_pdf)  # Should not raise
 
-        try:
-            validate_pdf_path(tmp_path)  # Should not raise
-        finally:
-            Path(tmp_path).unlink()
+    def test_path_object(self, valid_pdf):
+        """Test validation with a pathlib.Path argument."""
+        validate_pdf_path(Path(valid_pdf))  # Should not raise
 
     def test_nonexistent_pdf_path(self):
         """Test validation with non-existent PDF path."""
         with pytest.raises(FileNotFoundError):
             validate_pdf_path("/nonexistent/file.pdf")
 
-    def test_non_pdf_file(self):
+    def test_non_pdf_file(self, valid_txt):
         """Test validation with non-PDF file."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
-            tmp_path = tmp.name
+        with pytest.raises(ValueError, match=_NOT_PDF):
+            validate_pdf_path(valid_txt)
+
+    def test_inaccessible_pdf_path(self, monkeypatch):
+        """Test that an unreadable path is reported as ValueError."""
+        monkeypatch.setattr("src.utils.validators.os.stat", _deny_stat)
 
-        try:
-            with pytest.raises(ValueError, match="not a PDF"):
-                validate_pdf_path(tmp_path)
-        finally:
-            Path(tmp_path).unlink()
+        with pytest.raises(ValueError, match=_CANNOT_ACCESS):
+            validate_pdf_path("/denied/file.pdf")
 
-    def test_directory_instead_of_file(self):
+    def test_directory_instead_of_file(self, tmp_path):
         """Test validation with directory instead of file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(ValueError, match="not a file"):
-                validate_pdf_path(tmpdir)
+        with pytest.raises(ValueError, match=_NOT_FILE):
+            validate_pdf_path(str(tmp_path))
+
+
+class TestValidatePdfPaths:
+    """Test batch PDF path validation."""
+
+    def test_valid_pdf_paths(self, tmp_path):
+        """Test validation with several PDFs in one directory."""
+        paths = [tmp_path / f"{i}.pdf" for i in range(3)]
+        for path in paths:
+            path.touch()
+
+        validate_pdf_paths([str(path) for path in paths])  # Should not raise
+
+    def test_path_objects(self, tmp_path):
+        """Test validation with pathlib.Path arguments."""
+        pdf_path = tmp_path / "a.pdf"
+        pdf_path.touch()
+
+        validate_pdf_paths([pdf_path])  # Should not raise
+
+    def test_missing_pdf_in_batch(self, tmp_path):
+        """Test validation when one path in the batch is missing."""
+        existing = tmp_path / "a.pdf"
+        existing.touch()
+
+        with pytest.raises(FileNotFoundError):
+            validate_pdf_paths([str(existing), str(tmp_path / "b.pdf")])
+
+    def test_nonexistent_directory(self):
+        """Test validation with a path in a non-existent directory."""
+        with pytest.raises(FileNotFoundError):
+            validate_pdf_paths(["/nonexistent/file.pdf"])
+
+    def test_non_pdf_file_in_batch(self, tmp_path):
+        """Test validation when one file in the batch is not a PDF."""
+        text_file = tmp_path / "notes.txt"
+        text_file.touch()
+
+        with pytest.raises(ValueError, match=_NOT_PDF):
+            validate_pdf_paths([str(text_file)])
+
+    def test_directory_in_batch(self, tmp_path):
+        """Test validation when a path in the batch is a directory."""
+        with pytest.raises(ValueError, match=_NOT_FILE):
+            validate_pdf_paths([str(tmp_path)])
+
+    def test_trailing_separator_in_batch(self, tmp_path):
+        """Test that a directory with a trailing separator is not a file."""
+        with pytest.raises(ValueError, match=_NOT_FILE):
+            validate_pdf_paths([str(tmp_path) + os.sep])
+
+    def test_broken_symlink_in_batch(self, tmp_path):
+        """Test that a dangling symlink is reported as missing."""
+        link = tmp_path / "broken.pdf"
+        link.symlink_to(tmp_path / "missing.pdf")
+
+        with pytest.raises(FileNotFoundError):
+            validate_pdf_paths([str(link)])
+
+    def test_name_missing_from_listing(self, tmp_path, monkeypatch):
+        """Test that a file absent from the listing is checked with stat()."""
+        pdf_path = tmp_path / "Sample.pdf"
+        pdf_path.touch()
+
+        # Stand-in for a case-insensitive filesystem listing another case
+        monkeypatch.setattr("src.utils.validators.os.scandir", _empty_scandir)
+
+        validate_pdf_paths([str(pdf_path)])  # Should not raise
+
+    def test_unlistable_directory(self, tmp_path, monkeypatch):
+        """Test that a directory that cannot be listed falls back to stat()."""
+        pdf_path = tmp_path / "a.pdf"
+        pdf_path.touch()
+
+        monkeypatch.setattr("src.utils.validators.os.scandir", _deny_scandir)
+
+        validate_pdf_paths([str(pdf_path)])  # Should not raise
 
 
 class TestValidateOutputDir:
     """Test output directory validation."""
 
-    def test_valid_output_dir(self):
+    def test_valid_output_dir(self, valid_dir):
         """Test validation with valid output directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            validate_output_dir(tmpdir)  # Should not raise
+        validate_output_dir(valid_dir)  # Should not raise
+
+    def test_path_object(self, tmp_path):
+        """Test validation with a pathlib.Path argument."""
+        validate_output_dir(tmp_path / "output")  # Should not raise
 
     def test_nonexistent_parent_directory(self):
         """Test validation with non-existent parent directory."""
-        with pytest.raises(ValueError, match="Parent directory does not exist"):
+        with pytest.raises(ValueError, match=_PARENT_MISSING):
             validate_output_dir("/nonexistent/parent/output/")
 
-    def test_output_path_is_file(self):
+    def test_output_path_is_file(self, valid_txt):
         """Test validation when output path is a file."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp_path = tmp.name
+        with pytest.raises(ValueError, match=_NOT_DIR):
+            validate_output_dir(valid_txt)
 
-        try:
-            with pytest.raises(ValueError, match="not a directory"):
-                validate_output_dir(tmp_path)
-        finally:
-            Path(tmp_path).unlink()
-
-    def test_nonexistent_output_dir_valid_parent(self):
+    def test_nonexistent_output_dir_valid_parent(self, tmp_path):
         """Test validation with non-existent output dir but valid parent."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output"
-            validate_output_dir(str(output_path))  # Should not raise
+        output_path = tmp_path / "output"
+        validate_output_dir(str(output_path))  # Should not raise
 
 
 class TestValidateConfigPath:
     """Test configuration file validation."""
 
-    def test_valid_config_path(self):
+    def test_valid_config_path(self, valid_json):
         """Test validation with valid config path."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-            tmp_path = tmp.name
+        validate_config_path(valid_json)  # Should not raise
 
-        try:
-            validate_config_path(tmp_path)  # Should not raise
-        finally:
-            Path(tmp_path).unlink()
+    def test_path_object(self, valid_json):
+        """Test validation with a pathlib.Path argument."""
+        validate_config_path(Path(valid_json))  # Should not raise
 
     def test_nonexistent_config_path(self):
         """Test validation with non-existent config path."""
         with pytest.raises(FileNotFoundError):
             validate_config_path("/nonexistent/config.json")
 
-    def test_non_json_config_file(self):
+    def test_non_json_config_file(self, valid_txt):
         """Test validation with non-JSON config file."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            with pytest.raises(ValueError, match="must be JSON"):
-                validate_config_path(tmp_path)
-        finally:
-            Path(tmp_path).unlink()
+        with pytest.raises(ValueError, match=_MUST_BE_JSON):
+            validate_config_path(valid_txt)
 
-    def test_directory_instead_of_config_file(self):
+    def test_directory_instead_of_config_file(self, valid_dir):
         """Test validation with directory instead of config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(ValueError, match="not a file"):
-                validate_config_path(tmpdir)
+        with pytest.raises(ValueError, match=_NOT_FILE):
+            validate_config_path(valid_dir)
+
+
+class TestInvalidate:
+    """Test validation result caching."""
+
+    def test_cached_until_invalidated(self, tmp_path):
+        """Test that a cached success is dropped by invalidate()."""
+        pdf_path = tmp_path / "cached.pdf"
+        pdf_path.touch()
+
+        validate_pdf_path(str(pdf_path))
+        pdf_path.unlink()
+
+        validate_pdf_path(str(pdf_path))  # Served from cache
+
+        invalidate()
+        with pytest.raises(FileNotFoundError):
+            validate_pdf_path(str(pdf_path))
+
+    def test_output_dir_not_cached(self, tmp_path):
+        """Test that a file created at a validated output path is caught."""
+        output_path = tmp_path / "newout"
+        validate_output_dir(str(output_path))
+
+        output_path.touch()
+        with pytest.raises(ValueError, match=_NOT_DIR):
+            validate_output_dir(str(output_path))
+
+    def test_output_parent_cached_until_invalidated(self, tmp_path):
+        """Test that a known output parent is forgotten by invalidate()."""
+        parent = tmp_path / "parent"
+        parent.mkdir()
+        validate_output_dir(str(parent / "first"))
+        parent.rmdir()
+
+        validate_output_dir(str(parent / "second"))  # Parent from cache
+
+        invalidate()
+        with pytest.raises(ValueError, match=_PARENT_MISSING):
+            validate_output_dir(str(parent / "third"))